@@ -703,6 +703,9 @@ class Exchange(ExchangeApi):
             float
         ] = 0.05,  # only applicable to paginated requests such as fetching historical data
         rest_account_send_consecutive_request_delay_seconds: Optional[float] = 0.05,  # only applicable to paginated requests such as fetching historical data
+        rest_fetch_historical_data_max_concurrent_symbols: int = 1,  # symbols paginated concurrently at start, raise only if rate limits allow
+        rest_connection_keepalive_timeout_seconds: float = 75,  # keep idle connections longer than the periodic rest polling intervals so that polls reuse them
+        rest_dns_cache_ttl_seconds: Optional[int] = 300,  # None caches resolved addresses forever
         # settings for using Websocket API to stream realtime data from the exchange
         websocket_connection_protocol_level_heartbeat_period_seconds: Optional[int] = 10,
         websocket_connection_application_level_heartbeat_period_seconds: Optional[int] = 10,
@@ -812,6 +815,15 @@ class Exchange(ExchangeApi):
         self.rest_account_fetch_balance_period_seconds = rest_account_fetch_balance_period_seconds
         self.rest_market_data_send_consecutive_request_delay_seconds = rest_market_data_send_consecutive_request_delay_seconds
         self.rest_account_send_consecutive_request_delay_seconds = rest_account_send_consecutive_request_delay_seconds
+        self.rest_fetch_historical_data_max_concurrent_symbols = rest_fetch_historical_data_max_concurrent_symbols
+        if (
+            isinstance(rest_fetch_historical_data_max_concurrent_symbols, bool)
+            or not isinstance(rest_fetch_historical_data_max_concurrent_symbols, int)
+            or rest_fetch_historical_data_max_concurrent_symbols < 1
+        ):
+            raise ValueError(f"rest_fetch_historical_data_max_concurrent_symbols must be a positive integer for exchange {self.name}")
+        self.rest_connection_keepalive_timeout_seconds = rest_connection_keepalive_timeout_seconds
+        self.rest_dns_cache_ttl_seconds = rest_dns_cache_ttl_seconds
 
         self.websocket_connection_protocol_level_heartbeat_period_seconds = websocket_connection_protocol_level_heartbeat_period_seconds
         self.websocket_connection_application_level_heartbeat_period_seconds = websocket_connection_application_level_heartbeat_period_seconds
@@ -831,7 +843,11 @@ class Exchange(ExchangeApi):
         self.stop_wait_seconds = stop_wait_seconds
         self.send_consecutive_cancel_order_request_delay_seconds = send_consecutive_cancel_order_request_delay_seconds
 
-        self.client_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl))
+        self.client_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=ssl, keepalive_timeout=self.rest_connection_keepalive_timeout_seconds, ttl_dns_cache=self.rest_dns_cache_ttl_seconds
+            )
+        )
 
         if json_serialize:
             self.json_serialize = json_serialize
@@ -1305,41 +1321,9 @@ class Exchange(ExchangeApi):
         )
 
         if self.is_rest_response_success(rest_response=rest_response):
-            if self.is_rest_response_for_all_instrument_information(rest_response=rest_response):
-                await self.handle_rest_response_for_all_instrument_information(rest_response=rest_response)
-
-            elif self.is_rest_response_for_bbo(rest_response=rest_response):
-                await self.handle_rest_response_for_bbo(rest_response=rest_response)
-
-            elif self.is_rest_response_for_historical_trade(rest_response=rest_response):
-                await self.handle_rest_response_for_historical_trade(rest_response=rest_response)
-
-            elif self.is_rest_response_for_historical_ohlcv(rest_response=rest_response):
-                await self.handle_rest_response_for_historical_ohlcv(rest_response=rest_response)
-
-            elif self.is_rest_response_for_create_order(rest_response=rest_response):
-                await self.handle_rest_response_for_create_order(rest_response=rest_response)
-
-            elif self.is_rest_response_for_cancel_order(rest_response=rest_response):
-                await self.handle_rest_response_for_cancel_order(rest_response=rest_response)
-
-            elif self.is_rest_response_for_fetch_order(rest_response=rest_response):
-                await self.handle_rest_response_for_fetch_order(rest_response=rest_response)
-
-            elif self.is_rest_response_for_fetch_open_order(rest_response=rest_response):
-                await self.handle_rest_response_for_fetch_open_order(rest_response=rest_response)
-
-            elif self.is_rest_response_for_fetch_position(rest_response=rest_response):
-                await self.handle_rest_response_for_fetch_position(rest_response=rest_response)
-
-            elif self.is_rest_response_for_fetch_balance(rest_response=rest_response):
-                await self.handle_rest_response_for_fetch_balance(rest_response=rest_response)
-
-            elif self.is_rest_response_for_historical_order(rest_response=rest_response):
-                await self.handle_rest_response_for_historical_order(rest_response=rest_response)
-
-            elif self.is_rest_response_for_historical_fill(rest_response=rest_response):
-                await self.handle_rest_response_for_historical_fill(rest_response=rest_response)
+            rest_response_handler = self.get_rest_response_handler(rest_response=rest_response)
+            if rest_response_handler:
+                await rest_response_handler(rest_response=rest_response)
 
         else:
             await self.handle_rest_response_for_error(rest_response=rest_response)
@@ -1353,11 +1337,25 @@ class Exchange(ExchangeApi):
         await self.send_rest_request(rest_request_function=self.rest_market_data_fetch_bbo_create_rest_request_function())
 
     async def rest_market_data_fetch_historical_data(self):
-        for symbol in sorted(self.symbols):
-            if self.fetch_historical_trade_at_start:
-                await self.rest_market_data_fetch_historical_trade(symbol=symbol)
-            if self.fetch_historical_ohlcv_at_start:
-                await self.rest_market_data_fetch_historical_ohlcv(symbol=symbol)
+        semaphore = asyncio.Semaphore(self.rest_fetch_historical_data_max_concurrent_symbols)
+
+        async def rest_market_data_fetch_historical_data_for_symbol(symbol):
+            async with semaphore:
+                if self.rest_fetch_historical_data_max_concurrent_symbols > 1:
+                    # concurrency is opted into, and trades and ohlcvs page through separate endpoints, so a symbol's two histories are fetched together
+                    coros = []
+                    if self.fetch_historical_trade_at_start:
+                        coros.append(self.rest_market_data_fetch_historical_trade(symbol=symbol))
+                    if self.fetch_historical_ohlcv_at_start:
+                        coros.append(self.rest_market_data_fetch_historical_ohlcv(symbol=symbol))
+                    await asyncio.gather(*coros)
+                else:
+                    if self.fetch_historical_trade_at_start:
+                        await self.rest_market_data_fetch_historical_trade(symbol=symbol)
+                    if self.fetch_historical_ohlcv_at_start:
+                        await self.rest_market_data_fetch_historical_ohlcv(symbol=symbol)
+
+        await asyncio.gather(*(rest_market_data_fetch_historical_data_for_symbol(symbol) for symbol in sorted(self.symbols)))
 
     async def rest_market_data_fetch_historical_trade(self, *, symbol):
         await self.send_rest_request(rest_request_function=self.rest_market_data_fetch_historical_trade_create_rest_request_function(symbol=symbol))
@@ -1408,11 +1406,16 @@ class Exchange(ExchangeApi):
                     await asyncio.sleep(self.rest_account_send_consecutive_request_delay_seconds)
 
     async def rest_account_fetch_historical_data(self):
-        for symbol in sorted(self.symbols):
-            if self.fetch_historical_order_at_start:
-                await self.rest_account_fetch_historical_order(symbol=symbol)
-            if self.fetch_historical_fill_at_start:
-                await self.rest_account_fetch_historical_fill(symbol=symbol)
+        semaphore = asyncio.Semaphore(self.rest_fetch_historical_data_max_concurrent_symbols)
+
+        async def rest_account_fetch_historical_data_for_symbol(symbol):
+            async with semaphore:
+                if self.fetch_historical_order_at_start:
+                    await self.rest_account_fetch_historical_order(symbol=symbol)
+                if self.fetch_historical_fill_at_start:
+                    await self.rest_account_fetch_historical_fill(symbol=symbol)
+
+        await asyncio.gather(*(rest_account_fetch_historical_data_for_symbol(symbol) for symbol in sorted(self.symbols)))
 
     async def rest_account_fetch_historical_order(self, *, symbol):
         await self.send_rest_request(rest_request_function=self.rest_account_fetch_historical_order_create_rest_request_function(symbol=symbol))
@@ -1488,6 +1491,45 @@ class Exchange(ExchangeApi):
     def is_rest_response_success(self, *, rest_response):
         return rest_response.status_code >= 200 and rest_response.status_code < 300
 
+    def get_rest_response_handler(self, *, rest_response):
+        if self.is_rest_response_for_all_instrument_information(rest_response=rest_response):
+            return self.handle_rest_response_for_all_instrument_information
+
+        elif self.is_rest_response_for_bbo(rest_response=rest_response):
+            return self.handle_rest_response_for_bbo
+
+        elif self.is_rest_response_for_historical_trade(rest_response=rest_response):
+            return self.handle_rest_response_for_historical_trade
+
+        elif self.is_rest_response_for_historical_ohlcv(rest_response=rest_response):
+            return self.handle_rest_response_for_historical_ohlcv
+
+        elif self.is_rest_response_for_create_order(rest_response=rest_response):
+            return self.handle_rest_response_for_create_order
+
+        elif self.is_rest_response_for_cancel_order(rest_response=rest_response):
+            return self.handle_rest_response_for_cancel_order
+
+        elif self.is_rest_response_for_fetch_order(rest_response=rest_response):
+            return self.handle_rest_response_for_fetch_order
+
+        elif self.is_rest_response_for_fetch_open_order(rest_response=rest_response):
+            return self.handle_rest_response_for_fetch_open_order
+
+        elif self.is_rest_response_for_fetch_position(rest_response=rest_response):
+            return self.handle_rest_response_for_fetch_position
+
+        elif self.is_rest_response_for_fetch_balance(rest_response=rest_response):
+            return self.handle_rest_response_for_fetch_balance
+
+        elif self.is_rest_response_for_historical_order(rest_response=rest_response):
+            return self.handle_rest_response_for_historical_order
+
+        elif self.is_rest_response_for_historical_fill(rest_response=rest_response):
+            return self.handle_rest_response_for_historical_fill
+
+        return None
+
     def is_rest_response_for_all_instrument_information(self, *, rest_response):
         pass
 
@@ -1903,29 +1945,9 @@ class Exchange(ExchangeApi):
         self.logger.fine("websocket_message", websocket_message)
 
         if self.is_websocket_push_data(websocket_message=websocket_message):
-            if self.is_websocket_push_data_for_bbo(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_bbo(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_trade(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_trade(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_ohlcv(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_ohlcv(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_order(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_order(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_fill(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_fill(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_position(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_position(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_balance(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_balance(websocket_message=websocket_message)
-
-            elif self.is_websocket_push_data_for_system_event(websocket_message=websocket_message):
-                await self.handle_websocket_push_data_for_system_event(websocket_message=websocket_message)
+            websocket_push_data_handler = self.get_websocket_push_data_handler(websocket_message=websocket_message)
+            if websocket_push_data_handler:
+                await websocket_push_data_handler(websocket_message=websocket_message)
 
         elif self.is_websocket_response_success(websocket_message=websocket_message):
             if self.is_websocket_response_for_create_order(websocket_message=websocket_message):
@@ -1966,14 +1988,20 @@ class Exchange(ExchangeApi):
             )
 
     async def websocket_market_data_subscribe(self, *, websocket_connection):
+        await self.websocket_market_data_send_subscribe_requests(
+            websocket_connection=websocket_connection, create_websocket_request_function=self.websocket_market_data_update_subscribe_create_websocket_request
+        )
+
+    async def websocket_market_data_send_subscribe_requests(self, *, websocket_connection, create_websocket_request_function):
         symbols_subsets = convert_set_to_subsets(input=self.symbols, subset_length=self.websocket_market_data_channel_symbols_limit)
-        for symbols_subset in symbols_subsets:
+        for i, symbols_subset in enumerate(symbols_subsets):
+            # the delay only separates consecutive requests, so there is none before the first or after the last one
+            if i and self.websocket_market_data_channel_send_consecutive_request_delay_seconds:
+                await asyncio.sleep(self.websocket_market_data_channel_send_consecutive_request_delay_seconds)
             await self.send_websocket_request(
                 websocket_connection=websocket_connection,
-                websocket_request=self.websocket_market_data_update_subscribe_create_websocket_request(symbols=symbols_subset, is_subscribe=True),
+                websocket_request=create_websocket_request_function(symbols=symbols_subset, is_subscribe=True),
             )
-            if self.websocket_market_data_channel_send_consecutive_request_delay_seconds:
-                await asyncio.sleep(self.websocket_market_data_channel_send_consecutive_request_delay_seconds)
 
     async def websocket_account_connect(self):
         if self.subscribe_order or self.subscribe_fill or self.subscribe_position or self.subscribe_balance:
@@ -2053,6 +2081,33 @@ class Exchange(ExchangeApi):
     def is_websocket_push_data(self, *, websocket_message):
         return websocket_message.websocket_request_id is None
 
+    def get_websocket_push_data_handler(self, *, websocket_message):
+        if self.is_websocket_push_data_for_bbo(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_bbo
+
+        elif self.is_websocket_push_data_for_trade(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_trade
+
+        elif self.is_websocket_push_data_for_ohlcv(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_ohlcv
+
+        elif self.is_websocket_push_data_for_order(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_order
+
+        elif self.is_websocket_push_data_for_fill(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_fill
+
+        elif self.is_websocket_push_data_for_position(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_position
+
+        elif self.is_websocket_push_data_for_balance(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_balance
+
+        elif self.is_websocket_push_data_for_system_event(websocket_message=websocket_message):
+            return self.handle_websocket_push_data_for_system_event
+
+        return None
+
     def is_websocket_push_data_for_bbo(self, *, websocket_message):
         pass
 
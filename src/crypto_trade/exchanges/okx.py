@@ -1,9 +1,8 @@
-import asyncio
 import base64
 import hashlib
 import hmac
-from datetime import datetime, timezone
-from decimal import Decimal
+import time
+from typing import Callable, Dict, Tuple
 
 try:
     from enum import StrEnum
@@ -27,9 +26,8 @@ from crypto_trade.exchange_api import (
 from crypto_trade.utility import (
     RestRequest,
     WebsocketRequest,
-    convert_set_to_subsets,
     convert_unix_timestamp_milliseconds_to_time_point,
-    datetime_format_3,
+    is_decimal_string_zero,
     normalize_decimal_string,
     remove_leading_negative_sign_in_string,
     time_point_now,
@@ -81,6 +79,8 @@ class Okx(Exchange):
         self.websocket_market_data_channel_bbo = "bbo-tbt"
         self.websocket_market_data_channel_trade = "trades"
         self.websocket_market_data_channel_ohlcv = "candle"
+        self.ohlcv_interval_string = self.convert_ohlcv_interval_seconds_to_string(ohlcv_interval_seconds=self.ohlcv_interval_seconds)
+        self.websocket_market_data_channel_ohlcv_with_interval = self.websocket_market_data_channel_ohlcv + self.ohlcv_interval_string
         self.websocket_account_path = "/ws/v5/private"
         self.websocket_account_channel_order = "orders"
         self.websocket_account_channel_position = "positions"
@@ -96,12 +96,37 @@ class Okx(Exchange):
             "mmp_canceled": OrderStatus.CANCELED,
         }
 
+        self.margin_type_mapping = {
+            "isolated": MarginType.ISOLATED,
+            "cross": MarginType.CROSS,
+        }
+
         self.api_broker_id = "9cbc6a17a1fcBCDE"
+        self.api_secret_hmac = None
+        self.api_secret_hmac_api_secret = None
+        self.websocket_login_signature_timestamp = None
+        self.websocket_login_signature = None
+
+        self.instrument_type_string = str(self.instrument_type)
+        self.bbo_instrument_type_string = str(OkxInstrumentType.SPOT) if self.instrument_type == OkxInstrumentType.MARGIN else self.instrument_type_string
+        # shared by reference between requests, RestRequest never mutates its query params
+        self.instrument_type_query_params = {"instType": self.instrument_type_string}
+        self.bbo_instrument_type_query_params = {"instType": self.bbo_instrument_type_string}
+        self.is_instrument_type_derivative = self.instrument_type in (OkxInstrumentType.FUTURES, OkxInstrumentType.SWAP, OkxInstrumentType.OPTION)
+        self.is_instrument_type_margin = self.instrument_type == OkxInstrumentType.MARGIN
 
         if self.instrument_type == OkxInstrumentType.SPOT:
             self.subscribe_position = False
             self.rest_account_fetch_position_period_seconds = None
 
+        # handlers found through the is_rest_response_for_* predicates, memoized by request path and method since that is all the predicates look at
+        self.rest_response_handlers: Dict[Tuple[str, str], Callable] = {}
+
+        # handlers found through the is_websocket_push_data_for_* predicates, memoized by channel since that is all the predicates look at
+        self.websocket_push_data_handlers: Dict[str, Callable] = {}
+
+        self.websocket_account_subscribe_payload = self.json_serialize({"op": "subscribe", "args": self.websocket_account_create_subscribe_args()})
+
     def is_instrument_type_valid(self, *, instrument_type):
         return instrument_type in (
             OkxInstrumentType.SPOT,
@@ -126,30 +151,41 @@ class Okx(Exchange):
         headers = rest_request.headers
         headers["CONTENT-TYPE"] = "application/json"
         headers["OK-ACCESS-KEY"] = self.api_key
-        headers["OK-ACCESS-TIMESTAMP"] = (
-            f"{datetime.fromtimestamp(time_point[0], tz=timezone.utc).strftime(datetime_format_3)}.{str(time_point[1] // 1_000_000).zfill(3)}Z"
+        utc_time = time.gmtime(time_point[0])
+        headers["OK-ACCESS-TIMESTAMP"] = "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+            utc_time.tm_year,
+            utc_time.tm_mon,
+            utc_time.tm_mday,
+            utc_time.tm_hour,
+            utc_time.tm_min,
+            utc_time.tm_sec,
+            time_point[1] // 1_000_000,
         )
         headers["OK-ACCESS-PASSPHRASE"] = self.api_passphrase
-        headers["OK-ACCESS-SIGN"] = base64.b64encode(
-            hmac.new(
-                bytes(self.api_secret, "utf-8"),
-                bytes(f"{headers['OK-ACCESS-TIMESTAMP']}{rest_request.method}{rest_request.path_with_query_string}{rest_request.payload or ''}", "utf-8"),
-                digestmod=hashlib.sha256,
-            ).digest()
-        ).decode("utf-8")
+        signature = self.get_api_secret_hmac().copy()
+        signature.update(f"{headers['OK-ACCESS-TIMESTAMP']}{rest_request.method}{rest_request.path_with_query_string}{rest_request.payload or ''}".encode())
+        headers["OK-ACCESS-SIGN"] = base64.b64encode(signature.digest()).decode("ascii")
 
         if self.is_paper_trading:
             headers["x-simulated-trading"] = "1"
 
+    def get_api_secret_hmac(self):
+        # keyed lazily and rekeyed whenever api_secret is reassigned so that nothing is signed with a stale secret
+        if self.api_secret_hmac is None or self.api_secret != self.api_secret_hmac_api_secret:
+            self.api_secret_hmac = hmac.new((self.api_secret or "").encode(), digestmod=hashlib.sha256)
+            self.api_secret_hmac_api_secret = self.api_secret
+            self.websocket_login_signature_timestamp = None
+        return self.api_secret_hmac
+
     def rest_market_data_fetch_all_instrument_information_create_rest_request_function(self):
         return self.rest_market_data_create_get_request_function(
-            path=self.rest_market_data_fetch_all_instrument_information_path, query_params={"instType": f"{self.instrument_type}"}
+            path=self.rest_market_data_fetch_all_instrument_information_path, query_params=self.instrument_type_query_params
         )
 
     def rest_market_data_fetch_bbo_create_rest_request_function(self):
         return self.rest_market_data_create_get_request_function(
             path=self.rest_market_data_fetch_bbo_path,
-            query_params={"instType": f"{OkxInstrumentType.SPOT if self.instrument_type == OkxInstrumentType.MARGIN else self.instrument_type}"},
+            query_params=self.bbo_instrument_type_query_params,
         )
 
     def rest_market_data_fetch_historical_trade_create_rest_request_function(self, *, symbol):
@@ -168,7 +204,7 @@ class Okx(Exchange):
                     + self.ohlcv_interval_seconds
                 )
                 * 1000,
-                "bar": self.convert_ohlcv_interval_seconds_to_string(ohlcv_interval_seconds=self.ohlcv_interval_seconds),
+                "bar": self.ohlcv_interval_string,
                 "limit": self.rest_market_data_fetch_historical_ohlcv_limit,
             },
         )
@@ -197,12 +233,12 @@ class Okx(Exchange):
 
     def rest_account_fetch_open_order_create_rest_request_function(self):
         return self.rest_account_create_get_request_function_with_signature(
-            path=self.rest_account_fetch_open_order_path, query_params={"instType": f"{self.instrument_type}"}
+            path=self.rest_account_fetch_open_order_path, query_params=self.instrument_type_query_params
         )
 
     def rest_account_fetch_position_create_rest_request_function(self):
         return self.rest_account_create_get_request_function_with_signature(
-            path=self.rest_account_fetch_position_path, query_params={"instType": f"{self.instrument_type}"}
+            path=self.rest_account_fetch_position_path, query_params=self.instrument_type_query_params
         )
 
     def rest_account_fetch_balance_create_rest_request_function(self):
@@ -211,13 +247,13 @@ class Okx(Exchange):
     def rest_account_fetch_historical_order_create_rest_request_function(self, *, symbol):
         return self.rest_account_create_get_request_function_with_signature(
             path=self.rest_account_fetch_historical_order_path,
-            query_params={"instType": f"{self.instrument_type}", "instId": symbol, "limit": self.rest_account_fetch_historical_order_limit},
+            query_params={"instType": self.instrument_type_string, "instId": symbol, "limit": self.rest_account_fetch_historical_order_limit},
         )
 
     def rest_account_fetch_historical_fill_create_rest_request_function(self, *, symbol):
         return self.rest_account_create_get_request_function_with_signature(
             path=self.rest_account_fetch_historical_fill_path,
-            query_params={"instType": f"{self.instrument_type}", "instId": symbol, "limit": self.rest_account_fetch_historical_fill_limit},
+            query_params={"instType": self.instrument_type_string, "instId": symbol, "limit": self.rest_account_fetch_historical_fill_limit},
         )
 
     def is_rest_response_success(self, *, rest_response):
@@ -227,6 +263,16 @@ class Okx(Exchange):
             and rest_response.json_deserialized_payload["code"] == "0"
         )
 
+    def get_rest_response_handler(self, *, rest_response):
+        rest_request = rest_response.rest_request
+        key = (rest_request.path, rest_request.method)
+        rest_response_handler = self.rest_response_handlers.get(key)
+        if rest_response_handler is None:
+            rest_response_handler = super().get_rest_response_handler(rest_response=rest_response)
+            if rest_response_handler:
+                self.rest_response_handlers[key] = rest_response_handler
+        return rest_response_handler
+
     def is_rest_response_for_all_instrument_information(self, *, rest_response):
         return rest_response.rest_request.path == self.rest_market_data_fetch_all_instrument_information_path
 
@@ -271,26 +317,35 @@ class Okx(Exchange):
 
     def convert_rest_response_for_all_instrument_information(self, *, json_deserialized_payload, rest_request):
         result = []
+        api_method = ApiMethod.REST
+        normalize = normalize_decimal_string
 
         for x in json_deserialized_payload["data"]:
-            inst_family = x["instFamily"]
-            inst_family_has_dash = "-" in inst_family
+            base_asset = x["baseCcy"] or None
+            quote_asset = x["quoteCcy"] or None
+            if not (base_asset and quote_asset):
+                inst_family = x["instFamily"]
+                if "-" in inst_family:
+                    inst_family_split = inst_family.split("-")
+                    base_asset = base_asset or inst_family_split[0]
+                    quote_asset = quote_asset or inst_family_split[1]
+            exp_time = x["expTime"]
             result.append(
                 InstrumentInformation(
-                    api_method=ApiMethod.REST,
+                    api_method=api_method,
                     symbol=x["instId"],
-                    base_asset=x["baseCcy"] if x["baseCcy"] else (x["instFamily"].split("-")[0] if inst_family_has_dash else None),
-                    quote_asset=x["quoteCcy"] if x["quoteCcy"] else (x["instFamily"].split("-")[1] if inst_family_has_dash else None),
-                    order_price_increment=normalize_decimal_string(input=x["tickSz"]),
-                    order_quantity_increment=normalize_decimal_string(input=x["lotSz"]),
-                    order_quantity_min=normalize_decimal_string(input=x["minSz"]),
-                    order_quantity_max=normalize_decimal_string(input=x["maxLmtSz"]),
-                    order_quote_quantity_max=normalize_decimal_string(input=x["maxLmtAmt"]),
+                    base_asset=base_asset,
+                    quote_asset=quote_asset,
+                    order_price_increment=normalize(input=x["tickSz"]),
+                    order_quantity_increment=normalize(input=x["lotSz"]),
+                    order_quantity_min=normalize(input=x["minSz"]),
+                    order_quantity_max=normalize(input=x["maxLmtSz"]),
+                    order_quote_quantity_max=normalize(input=x["maxLmtAmt"]),
                     margin_asset=x["settleCcy"],
                     underlying_symbol=x["uly"],
-                    contract_size=normalize_decimal_string(input=x["ctVal"]),
-                    contract_multiplier=normalize_decimal_string(input=x["ctMult"]),
-                    expiry_time=int(expTime) // 1000 if (expTime := x["expTime"]) else None,
+                    contract_size=normalize(input=x["ctVal"]),
+                    contract_multiplier=normalize(input=x["ctMult"]),
+                    expiry_time=int(exp_time) // 1000 if exp_time else None,
                     is_open_for_trade=x["state"] in ("live", "preopen"),
                 )
             )
@@ -298,9 +353,12 @@ class Okx(Exchange):
         return result
 
     def convert_rest_response_for_bbo(self, *, json_deserialized_payload, rest_request):
+        api_method = ApiMethod.REST
+        symbols = self.symbols
+
         return [
             Bbo(
-                api_method=ApiMethod.REST,
+                api_method=api_method,
                 symbol=inst_id,
                 exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
                 best_bid_price=x.get("bidPx"),
@@ -309,34 +367,23 @@ class Okx(Exchange):
                 best_ask_size=x.get("askSz"),
             )
             for x in json_deserialized_payload["data"]
-            if (inst_id := x["instId"]) in self.symbols
+            if (inst_id := x["instId"]) in symbols
         ]
 
     def convert_rest_response_for_historical_trade(self, *, json_deserialized_payload, rest_request):
-        return [self.convert_dict_to_trade(input=x, api_method=ApiMethod.REST, symbol=x["instId"]) for x in json_deserialized_payload["data"]]
+        inst_id = rest_request.query_params["instId"]
+
+        return self.convert_list_to_trades(input=json_deserialized_payload["data"], api_method=ApiMethod.REST, symbol=inst_id)
 
     def convert_rest_response_for_historical_trade_to_next_rest_request_function(self, *, json_deserialized_payload, rest_request):
         data = json_deserialized_payload["data"]
 
         if data:
             head = data[0]
-            head_exchange_update_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=head["ts"])
-            head_trade_id_as_int = int(head["tradeId"])
             tail = data[-1]
-            tail_exchange_update_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=tail["ts"])
-            tail_trade_id_as_int = int(tail["tradeId"])
-
-            if (head_exchange_update_time_point, head_trade_id_as_int) < (tail_exchange_update_time_point, tail_trade_id_as_int):
-                after = head_trade_id_as_int
-                exchange_update_time_point = head_exchange_update_time_point
-            else:
-                after = tail_trade_id_as_int
+            ts, after = min((int(head["ts"]), int(head["tradeId"])), (int(tail["ts"]), int(tail["tradeId"])))
 
-                exchange_update_time_point = tail_exchange_update_time_point
-            if (
-                self.fetch_historical_trade_start_unix_timestamp_seconds is None
-                or exchange_update_time_point[0] >= self.fetch_historical_trade_start_unix_timestamp_seconds
-            ):
+            if self.fetch_historical_trade_start_unix_timestamp_seconds is None or ts // 1000 >= self.fetch_historical_trade_start_unix_timestamp_seconds:
                 return self.rest_market_data_create_get_request_function(
                     path=self.rest_market_data_fetch_historical_trade_path,
                     query_params={"instId": head["instId"], "type": 1, "after": after, "limit": self.rest_market_data_fetch_historical_trade_limit},
@@ -345,21 +392,13 @@ class Okx(Exchange):
     def convert_rest_response_for_historical_ohlcv(self, *, json_deserialized_payload, rest_request):
         inst_id = rest_request.query_params["instId"]
 
-        return [self.convert_dict_to_ohlcv(input=x, api_method=ApiMethod.REST, symbol=inst_id) for x in json_deserialized_payload["data"]]
+        return self.convert_list_to_ohlcvs(input=json_deserialized_payload["data"], api_method=ApiMethod.REST, symbol=inst_id)
 
     def convert_rest_response_for_historical_ohlcv_to_next_rest_request_function(self, *, json_deserialized_payload, rest_request):
         data = json_deserialized_payload["data"]
 
         if data:
-            head = data[0]
-            head_ts = int(head[0])
-            tail = data[-1]
-            tail_ts = int(tail[0])
-
-            if head_ts < tail_ts:
-                after = head_ts
-            else:
-                after = tail_ts
+            after = min(int(data[0][0]), int(data[-1][0]))
 
             if self.fetch_historical_ohlcv_start_unix_timestamp_seconds is None or after // 1000 >= self.fetch_historical_ohlcv_start_unix_timestamp_seconds:
                 return self.rest_market_data_create_get_request_function(
@@ -367,7 +406,7 @@ class Okx(Exchange):
                     query_params={
                         "instId": rest_request.query_params["instId"],
                         "after": after,
-                        "bar": self.convert_ohlcv_interval_seconds_to_string(ohlcv_interval_seconds=self.ohlcv_interval_seconds),
+                        "bar": self.ohlcv_interval_string,
                         "limit": self.rest_market_data_fetch_historical_ohlcv_limit,
                     },
                 )
@@ -403,64 +442,51 @@ class Okx(Exchange):
         return self.convert_dict_to_order(input=x, api_method=ApiMethod.REST, symbol=x["instId"])
 
     def convert_rest_response_for_fetch_open_order(self, *, json_deserialized_payload, rest_request):
-        return [self.convert_dict_to_order(input=x, api_method=ApiMethod.REST, symbol=x["instId"]) for x in json_deserialized_payload["data"]]
+        convert_dict_to_order = self.convert_dict_to_order
+
+        return [convert_dict_to_order(input=x, api_method=ApiMethod.REST, symbol=x["instId"]) for x in json_deserialized_payload["data"]]
 
     def convert_rest_response_for_fetch_open_order_to_next_rest_request_function(self, *, json_deserialized_payload, rest_request):
         data = json_deserialized_payload["data"]
 
         if data:
-            head = data[0]
-            head_ord_id = head["ordId"]
-            tail = data[-1]
-            tail_ord_id = tail["ordId"]
-
-            if head_ord_id < tail_ord_id:
-                after = head_ord_id
-            else:
-                after = tail_ord_id
+            after = min(data[0]["ordId"], data[-1]["ordId"])
 
             return self.rest_account_create_get_request_function_with_signature(
                 path=self.rest_account_fetch_open_order_path,
-                query_params={"instType": f"{self.instrument_type}", "after": after, "limit": self.rest_account_fetch_open_order_limit},
+                query_params={"instType": self.instrument_type_string, "after": after, "limit": self.rest_account_fetch_open_order_limit},
             )
 
     def convert_rest_response_for_fetch_position(self, *, json_deserialized_payload, rest_request):
-        return [self.convert_dict_to_position(input=x, api_method=ApiMethod.REST) for x in json_deserialized_payload["data"]]
+        convert_dict_to_position = self.convert_dict_to_position
+
+        return [convert_dict_to_position(input=x, api_method=ApiMethod.REST) for x in json_deserialized_payload["data"]]
 
     def convert_rest_response_for_fetch_balance(self, *, json_deserialized_payload, rest_request):
-        return [self.convert_dict_to_balance(input=x, api_method=ApiMethod.REST) for x in json_deserialized_payload["data"][0]["details"]]
+        convert_dict_to_balance = self.convert_dict_to_balance
+
+        return [convert_dict_to_balance(input=x, api_method=ApiMethod.REST) for x in json_deserialized_payload["data"][0]["details"]]
 
     def convert_rest_response_for_historical_order(self, *, json_deserialized_payload, rest_request):
         inst_id = rest_request.query_params["instId"]
 
-        return [self.convert_dict_to_order(input=x, api_method=ApiMethod.REST, symbol=inst_id) for x in json_deserialized_payload["data"]]
+        convert_dict_to_order = self.convert_dict_to_order
+
+        return [convert_dict_to_order(input=x, api_method=ApiMethod.REST, symbol=inst_id) for x in json_deserialized_payload["data"]]
 
     def convert_rest_response_for_historical_order_to_next_rest_request_function(self, *, json_deserialized_payload, rest_request):
         data = json_deserialized_payload["data"]
 
         if data:
             head = data[0]
-            head_exchange_create_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=head["cTime"])
-            head_order_id_as_int = int(head["ordId"])
             tail = data[-1]
-            tail_exchange_create_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=tail["cTime"])
-            tail_order_id_as_int = int(tail["ordId"])
-
-            if (head_exchange_create_time_point, head_order_id_as_int) < (tail_exchange_create_time_point, tail_order_id_as_int):
-                after = head_order_id_as_int
-                exchange_create_time_point = head_exchange_create_time_point
-            else:
-                after = tail_order_id_as_int
-                exchange_create_time_point = tail_exchange_create_time_point
+            c_time, after = min((int(head["cTime"]), int(head["ordId"])), (int(tail["cTime"]), int(tail["ordId"])))
 
-            if (
-                self.fetch_historical_order_start_unix_timestamp_seconds is None
-                or exchange_create_time_point[0] >= self.fetch_historical_order_start_unix_timestamp_seconds
-            ):
+            if self.fetch_historical_order_start_unix_timestamp_seconds is None or c_time // 1000 >= self.fetch_historical_order_start_unix_timestamp_seconds:
                 return self.rest_account_create_get_request_function_with_signature(
                     path=rest_request.path,
                     query_params={
-                        "instType": f"{self.instrument_type}",
+                        "instType": self.instrument_type_string,
                         "instId": rest_request.query_params["instId"],
                         "after": after,
                         "limit": self.rest_account_fetch_historical_order_limit,
@@ -468,7 +494,7 @@ class Okx(Exchange):
                 )
         elif rest_request.path == self.rest_account_fetch_historical_order_path:
             query_params = {
-                "instType": f"{self.instrument_type}",
+                "instType": self.instrument_type_string,
                 "instId": rest_request.query_params["instId"],
                 "limit": self.rest_account_fetch_historical_order_limit,
             }
@@ -481,34 +507,23 @@ class Okx(Exchange):
     def convert_rest_response_for_historical_fill(self, *, json_deserialized_payload, rest_request):
         inst_id = rest_request.query_params["instId"]
 
-        return [self.convert_dict_to_fill(input=x, api_method=ApiMethod.REST, symbol=inst_id) for x in json_deserialized_payload["data"]]
+        convert_dict_to_fill = self.convert_dict_to_fill
+
+        return [convert_dict_to_fill(input=x, api_method=ApiMethod.REST, symbol=inst_id) for x in json_deserialized_payload["data"]]
 
     def convert_rest_response_for_historical_fill_to_next_rest_request_function(self, *, json_deserialized_payload, rest_request):
         data = json_deserialized_payload["data"]
 
         if data:
             head = data[0]
-            head_exchange_update_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=head["fillTime"])
-            head_bill_id_as_int = int(head["billId"])
             tail = data[-1]
-            tail_exchange_update_time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=tail["fillTime"])
-            tail_bill_id_as_int = int(tail["billId"])
-
-            if (head_exchange_update_time_point, head_bill_id_as_int) < (tail_exchange_update_time_point, tail_bill_id_as_int):
-                after = head_bill_id_as_int
-                exchange_update_time_point = head_exchange_update_time_point
-            else:
-                after = tail_bill_id_as_int
-                exchange_update_time_point = tail_exchange_update_time_point
+            fill_time, after = min((int(head["fillTime"]), int(head["billId"])), (int(tail["fillTime"]), int(tail["billId"])))
 
-            if (
-                self.fetch_historical_fill_start_unix_timestamp_seconds is None
-                or exchange_update_time_point[0] >= self.fetch_historical_fill_start_unix_timestamp_seconds
-            ):
+            if self.fetch_historical_fill_start_unix_timestamp_seconds is None or fill_time // 1000 >= self.fetch_historical_fill_start_unix_timestamp_seconds:
                 return self.rest_account_create_get_request_function_with_signature(
                     path=rest_request.path,
                     query_params={
-                        "instType": f"{self.instrument_type}",
+                        "instType": self.instrument_type_string,
                         "instId": rest_request.query_params["instId"],
                         "after": after,
                         "limit": self.rest_account_fetch_historical_fill_limit,
@@ -516,7 +531,7 @@ class Okx(Exchange):
                 )
         elif rest_request.path == self.rest_account_fetch_historical_fill_path:
             query_params = {
-                "instType": f"{self.instrument_type}",
+                "instType": self.instrument_type_string,
                 "instId": rest_request.query_params["instId"],
                 "limit": self.rest_account_fetch_historical_fill_limit,
             }
@@ -581,24 +596,16 @@ class Okx(Exchange):
                 )
 
     async def websocket_market_data_subscribe_for_bbo_trade(self, *, websocket_connection):
-        symbols_subsets = convert_set_to_subsets(input=self.symbols, subset_length=self.websocket_market_data_channel_symbols_limit)
-        for symbols_subset in symbols_subsets:
-            await self.send_websocket_request(
-                websocket_connection=websocket_connection,
-                websocket_request=self.websocket_market_data_update_subscribe_create_websocket_request_for_bbo_trade(symbols=symbols_subset, is_subscribe=True),
-            )
-            if self.websocket_market_data_channel_send_consecutive_request_delay_seconds:
-                await asyncio.sleep(self.websocket_market_data_channel_send_consecutive_request_delay_seconds)
+        await self.websocket_market_data_send_subscribe_requests(
+            websocket_connection=websocket_connection,
+            create_websocket_request_function=self.websocket_market_data_update_subscribe_create_websocket_request_for_bbo_trade,
+        )
 
     async def websocket_market_data_subscribe_for_ohlcv(self, *, websocket_connection):
-        symbols_subsets = convert_set_to_subsets(input=self.symbols, subset_length=self.websocket_market_data_channel_symbols_limit)
-        for symbols_subset in symbols_subsets:
-            await self.send_websocket_request(
-                websocket_connection=websocket_connection,
-                websocket_request=self.websocket_market_data_update_subscribe_create_websocket_request_for_ohlcv(symbols=symbols_subset, is_subscribe=True),
-            )
-            if self.websocket_market_data_channel_send_consecutive_request_delay_seconds:
-                await asyncio.sleep(self.websocket_market_data_channel_send_consecutive_request_delay_seconds)
+        await self.websocket_market_data_send_subscribe_requests(
+            websocket_connection=websocket_connection,
+            create_websocket_request_function=self.websocket_market_data_update_subscribe_create_websocket_request_for_ohlcv,
+        )
 
     def websocket_connection_ping_on_application_level_create_websocket_request(self):
         payload = "ping"
@@ -610,9 +617,7 @@ class Okx(Exchange):
         arg["apiKey"] = self.api_key
         arg["passphrase"] = self.api_passphrase
         arg["timestamp"] = time_point[0]
-        arg["sign"] = base64.b64encode(
-            hmac.new(bytes(self.api_secret, "utf-8"), bytes(f"{arg['timestamp']}GET/users/self/verify", "utf-8"), digestmod=hashlib.sha256).digest()
-        ).decode("utf-8")
+        arg["sign"] = self.websocket_login_create_signature(timestamp=arg["timestamp"])
         payload = self.json_serialize(
             {
                 "op": "login",
@@ -621,6 +626,16 @@ class Okx(Exchange):
         )
         return self.websocket_create_request(payload=payload)
 
+    def websocket_login_create_signature(self, *, timestamp):
+        # logins on several connections (or quick reconnects) within the same second share one signature
+        api_secret_hmac = self.get_api_secret_hmac()
+        if timestamp != self.websocket_login_signature_timestamp:
+            signature = api_secret_hmac.copy()
+            signature.update(f"{timestamp}GET/users/self/verify".encode())
+            self.websocket_login_signature = base64.b64encode(signature.digest()).decode("ascii")
+            self.websocket_login_signature_timestamp = timestamp
+        return self.websocket_login_signature
+
     def websocket_market_data_update_subscribe_create_websocket_request_for_bbo_trade(self, *, symbols, is_subscribe):
         args = []
 
@@ -636,26 +651,20 @@ class Okx(Exchange):
     def websocket_market_data_update_subscribe_create_websocket_request_for_ohlcv(self, *, symbols, is_subscribe):
         args = []
 
-        for symbol in self.symbols:
-            args.append(
-                {
-                    "channel": self.websocket_market_data_channel_ohlcv
-                    + self.convert_ohlcv_interval_seconds_to_string(ohlcv_interval_seconds=self.ohlcv_interval_seconds),
-                    "instId": symbol,
-                }
-            )
+        for symbol in symbols:
+            args.append({"channel": self.websocket_market_data_channel_ohlcv_with_interval, "instId": symbol})
 
         payload = self.json_serialize({"op": "subscribe", "args": args})
         return self.websocket_create_request(payload=payload)
 
-    def websocket_account_update_subscribe_create_websocket_request(self, *, is_subscribe):
+    def websocket_account_create_subscribe_args(self):
         args = []
 
         if self.subscribe_order or self.subscribe_fill:
             args.append(
                 {
                     "channel": self.websocket_account_channel_order,
-                    "instType": f"{self.instrument_type}",
+                    "instType": self.instrument_type_string,
                 }
             )
 
@@ -663,7 +672,7 @@ class Okx(Exchange):
             args.append(
                 {
                     "channel": self.websocket_account_channel_position,
-                    "instType": f"{self.instrument_type}",
+                    "instType": self.instrument_type_string,
                 }
             )
 
@@ -671,12 +680,14 @@ class Okx(Exchange):
             args.append(
                 {
                     "channel": self.websocket_account_channel_balance,
-                    "instType": f"{self.instrument_type}",
+                    "instType": self.instrument_type_string,
                 }
             )
 
-        payload = self.json_serialize({"op": "subscribe", "args": args})
-        return self.websocket_create_request(payload=payload)
+        return args
+
+    def websocket_account_update_subscribe_create_websocket_request(self, *, is_subscribe):
+        return self.websocket_create_request(payload=self.websocket_account_subscribe_payload)
 
     def websocket_account_create_order_create_websocket_request(self, *, order):
         id = self.generate_next_websocket_request_id()
@@ -697,19 +708,18 @@ class Okx(Exchange):
 
     def websocket_on_message_extract_data(self, *, websocket_connection, websocket_message):
         json_deserialized_payload = websocket_message.json_deserialized_payload
+        arg = json_deserialized_payload.get("arg")
 
         websocket_message.payload_summary = {
             "event": json_deserialized_payload.get("event"),
             "op": json_deserialized_payload.get("op"),
-            "channel": json_deserialized_payload.get("arg", {}).get("channel"),
+            "channel": arg.get("channel") if arg else None,
             "code": json_deserialized_payload.get("code"),
         }
 
-        id = json_deserialized_payload.get("id")
-        websocket_message.websocket_request_id = str(id) if id is not None else None
-
-        if websocket_message.websocket_request_id:
-            websocket_message.websocket_request = self.websocket_requests.get(websocket_message.websocket_request_id)
+        # okx echoes back the string id sent with the request, which is already the key used in self.websocket_requests
+        # the matching websocket_request is popped and attached by websocket_on_message right after this
+        websocket_message.websocket_request_id = json_deserialized_payload.get("id")
 
         return websocket_message
 
@@ -717,6 +727,15 @@ class Okx(Exchange):
         payload_summary = websocket_message.payload_summary
         return payload_summary["event"] is None and payload_summary["op"] is None
 
+    def get_websocket_push_data_handler(self, *, websocket_message):
+        channel = websocket_message.payload_summary["channel"]
+        websocket_push_data_handler = self.websocket_push_data_handlers.get(channel)
+        if websocket_push_data_handler is None:
+            websocket_push_data_handler = super().get_websocket_push_data_handler(websocket_message=websocket_message)
+            if websocket_push_data_handler:
+                self.websocket_push_data_handlers[channel] = websocket_push_data_handler
+        return websocket_push_data_handler
+
     def is_websocket_push_data_for_bbo(self, *, websocket_message):
         payload_summary = websocket_message.payload_summary
         return payload_summary["channel"] == self.websocket_market_data_channel_bbo
@@ -763,66 +782,82 @@ class Okx(Exchange):
 
     def convert_websocket_push_data_for_bbo(self, *, json_deserialized_payload):
         inst_id = json_deserialized_payload["arg"]["instId"]
+        result = []
 
-        return [
-            Bbo(
-                api_method=ApiMethod.WEBSOCKET,
-                symbol=inst_id,
-                exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
-                best_bid_price=x["bids"][0][0] if x.get("bids") else None,
-                best_bid_size=x["bids"][0][1] if x.get("bids") else None,
-                best_ask_price=x["asks"][0][0] if x.get("asks") else None,
-                best_ask_size=x["asks"][0][1] if x.get("asks") else None,
+        for x in json_deserialized_payload["data"]:
+            bids = x.get("bids")
+            best_bid = bids[0] if bids else (None, None)
+            asks = x.get("asks")
+            best_ask = asks[0] if asks else (None, None)
+            result.append(
+                Bbo(
+                    api_method=ApiMethod.WEBSOCKET,
+                    symbol=inst_id,
+                    exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
+                    best_bid_price=best_bid[0],
+                    best_bid_size=best_bid[1],
+                    best_ask_price=best_ask[0],
+                    best_ask_size=best_ask[1],
+                )
             )
-            for x in json_deserialized_payload["data"]
-        ]
+
+        return result
 
     def convert_websocket_push_data_for_trade(self, *, json_deserialized_payload):
         inst_id = json_deserialized_payload["arg"]["instId"]
 
-        return [self.convert_dict_to_trade(input=x, api_method=ApiMethod.WEBSOCKET, symbol=inst_id) for x in json_deserialized_payload["data"]]
+        return self.convert_list_to_trades(input=json_deserialized_payload["data"], api_method=ApiMethod.WEBSOCKET, symbol=inst_id)
 
     def convert_websocket_push_data_for_ohlcv(self, *, json_deserialized_payload):
         inst_id = json_deserialized_payload["arg"]["instId"]
 
-        return [self.convert_dict_to_ohlcv(input=x, api_method=ApiMethod.WEBSOCKET, symbol=inst_id) for x in json_deserialized_payload["data"]]
+        return self.convert_list_to_ohlcvs(input=json_deserialized_payload["data"], api_method=ApiMethod.WEBSOCKET, symbol=inst_id)
 
     def convert_websocket_push_data_for_order(self, *, json_deserialized_payload):
-        return [self.convert_dict_to_order(input=x, api_method=ApiMethod.WEBSOCKET, symbol=x["instId"]) for x in json_deserialized_payload["data"]]
+        convert_dict_to_order = self.convert_dict_to_order
+
+        return [convert_dict_to_order(input=x, api_method=ApiMethod.WEBSOCKET, symbol=x["instId"]) for x in json_deserialized_payload["data"]]
 
     def convert_websocket_push_data_for_fill(self, *, json_deserialized_payload):
-        return [
-            self.convert_dict_to_fill(input=x, api_method=ApiMethod.WEBSOCKET, symbol=x["instId"]) for x in json_deserialized_payload["data"] if x["tradeId"]
-        ]
+        convert_dict_to_fill = self.convert_dict_to_fill
+
+        return [convert_dict_to_fill(input=x, api_method=ApiMethod.WEBSOCKET, symbol=x["instId"]) for x in json_deserialized_payload["data"] if x["tradeId"]]
 
     def convert_websocket_push_data_for_position(self, *, json_deserialized_payload):
-        return [self.convert_dict_to_position(input=x, api_method=ApiMethod.WEBSOCKET) for x in json_deserialized_payload["data"]]
+        convert_dict_to_position = self.convert_dict_to_position
+
+        return [convert_dict_to_position(input=x, api_method=ApiMethod.WEBSOCKET) for x in json_deserialized_payload["data"]]
 
     def convert_websocket_push_data_for_balance(self, *, json_deserialized_payload):
-        return [self.convert_dict_to_balance(input=x, api_method=ApiMethod.WEBSOCKET) for x in json_deserialized_payload["data"][0]["balData"]]
+        convert_dict_to_balance = self.convert_dict_to_balance
+
+        return [convert_dict_to_balance(input=x, api_method=ApiMethod.WEBSOCKET) for x in json_deserialized_payload["data"][0]["balData"]]
 
     def convert_websocket_response_for_create_order(self, *, json_deserialized_payload, websocket_request):
         x = json_deserialized_payload["data"][0]
+        arg = websocket_request.json_payload["args"][0]
+        time_point = convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"])
 
         return Order(
             api_method=ApiMethod.WEBSOCKET,
-            symbol=websocket_request.json_payload["args"][0]["instId"],
-            exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
+            symbol=arg["instId"],
+            exchange_update_time_point=time_point,
             order_id=x["ordId"],
-            client_order_id=websocket_request.json_payload["args"][0].get("clOrdId"),
-            exchange_create_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
+            client_order_id=arg.get("clOrdId"),
+            exchange_create_time_point=time_point,
             status=OrderStatus.CREATE_ACKNOWLEDGED,
         )
 
     def convert_websocket_response_for_cancel_order(self, *, json_deserialized_payload, websocket_request):
         x = json_deserialized_payload["data"][0]
+        arg = websocket_request.json_payload["args"][0]
 
         return Order(
             api_method=ApiMethod.WEBSOCKET,
-            symbol=websocket_request.json_payload["args"][0]["instId"],
+            symbol=arg["instId"],
             exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=x["ts"]),
-            order_id=websocket_request.json_payload["args"][0].get("ordId"),
-            client_order_id=websocket_request.json_payload["args"][0].get("clOrdId"),
+            order_id=arg.get("ordId"),
+            client_order_id=arg.get("clOrdId"),
             status=OrderStatus.CANCEL_ACKNOWLEDGED,
         )
 
@@ -877,7 +912,7 @@ class Okx(Exchange):
 
         json_payload = {
             "instId": order.symbol,
-            "tdMode": order.margin_type.value.lower() if order.margin_type else "cash",
+            "tdMode": order.margin_type.value if order.margin_type else "cash",
             "clOrdId": order.client_order_id,
             "side": "buy" if order.is_buy else "sell",
             "ordType": ord_type,
@@ -904,32 +939,45 @@ class Okx(Exchange):
             json_payload["clOrdId"] = client_order_id
         return json_payload
 
-    def convert_dict_to_trade(self, *, input, api_method, symbol):
-        return Trade(
-            api_method=api_method,
-            symbol=symbol,
-            exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=input["ts"]),
-            trade_id=input["tradeId"],
-            price=input["px"],
-            size=input["sz"],
-            is_buyer_maker=input["side"] == "sell",
-        )
+    def convert_list_to_trades(self, *, input, api_method, symbol):
+        convert_to_time_point = convert_unix_timestamp_milliseconds_to_time_point
 
-    def convert_dict_to_ohlcv(self, *, input, api_method, symbol):
-        return Ohlcv(
-            api_method=api_method,
-            symbol=symbol,
-            start_unix_timestamp_seconds=int(input[0]) // 1000,
-            open_price=input[1],
-            high_price=input[2],
-            low_price=input[3],
-            close_price=input[4],
-            volume=input[5],
-            base_volume=input[5] if self.instrument_type in (OkxInstrumentType.SPOT, OkxInstrumentType.MARGIN) else input[6],
-            quote_volume=input[7],
-        )
+        return [
+            Trade(
+                api_method=api_method,
+                symbol=symbol,
+                exchange_update_time_point=convert_to_time_point(unix_timestamp_milliseconds=x["ts"]),
+                trade_id=x["tradeId"],
+                price=x["px"],
+                size=x["sz"],
+                is_buyer_maker=x["side"] == "sell",
+            )
+            for x in input
+        ]
+
+    def convert_list_to_ohlcvs(self, *, input, api_method, symbol):
+        # the base volume column depends only on the instrument type, so it is resolved once per batch
+        base_volume_index = 5 if self.instrument_type in (OkxInstrumentType.SPOT, OkxInstrumentType.MARGIN) else 6
+
+        return [
+            Ohlcv(
+                api_method=api_method,
+                symbol=symbol,
+                start_unix_timestamp_seconds=int(x[0]) // 1000,
+                open_price=x[1],
+                high_price=x[2],
+                low_price=x[3],
+                close_price=x[4],
+                volume=x[5],
+                base_volume=x[base_volume_index],
+                quote_volume=x[7],
+            )
+            for x in input
+        ]
 
     def convert_dict_to_order(self, *, input, api_method, symbol):
+        ord_type = input["ordType"]
+
         return Order(
             api_method=api_method,
             symbol=symbol,
@@ -939,23 +987,28 @@ class Okx(Exchange):
             is_buy=input["side"] == "buy",
             price=input["px"] or None,
             quantity=input["sz"],
-            is_market=input["ordType"] == "market",
-            is_post_only=input["ordType"] == "post_only",
-            is_fok=input["ordType"] == "fok",
-            is_ioc=input["ordType"] == "ioc",
+            is_market=ord_type == "market",
+            is_post_only=ord_type == "post_only",
+            is_fok=ord_type == "fok",
+            is_ioc=ord_type == "ioc",
             is_reduce_only=input["reduceOnly"] == "true",
-            margin_type=MarginType[input["tdMode"].upper()] if input["tdMode"] != "cash" else None,
+            margin_type=self.margin_type_mapping.get(input["tdMode"]),
             margin_asset=input["ccy"],
             cumulative_filled_quantity=input["accFillSz"] or None,
-            average_filled_price=input["avgPx"] if input["avgPx"] else None,
+            average_filled_price=input["avgPx"] or None,
             exchange_create_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=input["cTime"]),
             status=self.order_status_mapping.get(input["state"]),
         )
 
     def convert_dict_to_fill(self, *, input, api_method, symbol):
-        fill_fee = input.get("fillFee", input.get("fee"))
-        fill_fee_ccy = input.get("fillFeeCcy", input.get("feeCcy"))
-        is_fee_rebate = not fill_fee.startswith("-") if fill_fee and not Decimal(fill_fee).is_zero() else None
+        fill_fee = input.get("fillFee")
+        if fill_fee is None:
+            fill_fee = input.get("fee")
+        fill_fee_ccy = input.get("fillFeeCcy")
+        if fill_fee_ccy is None:
+            fill_fee_ccy = input.get("feeCcy")
+        exec_type = input.get("execType")
+        is_fee_rebate = fill_fee[0] != "-" if fill_fee and not is_decimal_string_zero(input=fill_fee) else None
 
         return Fill(
             api_method=api_method,
@@ -967,7 +1020,7 @@ class Okx(Exchange):
             is_buy=input["side"] == "buy",
             price=input["fillPx"],
             quantity=input["fillSz"],
-            is_maker=input["execType"] == "M" if input.get("execType") else None,
+            is_maker=exec_type == "M" if exec_type else None,
             fee_asset=fill_fee_ccy,
             fee_quantity=remove_leading_negative_sign_in_string(input=fill_fee) if fill_fee else None,
             is_fee_rebate=is_fee_rebate,
@@ -979,19 +1032,15 @@ class Okx(Exchange):
         symbol = input["instId"]
         is_long = None
 
-        if not Decimal(pos).is_zero():
+        if not is_decimal_string_zero(input=pos):
             if pos_side == "long":
                 is_long = True
             elif pos_side == "short":
                 is_long = False
             else:
-                if (
-                    self.instrument_type == OkxInstrumentType.FUTURES
-                    or self.instrument_type == OkxInstrumentType.SWAP
-                    or self.instrument_type == OkxInstrumentType.OPTION
-                ):
-                    is_long = not pos.startswith("-")
-                elif self.instrument_type == OkxInstrumentType.MARGIN:
+                if self.is_instrument_type_derivative:
+                    is_long = pos[0] != "-"
+                elif self.is_instrument_type_margin:
                     if symbol in self.all_instrument_information:
                         instrument_information_for_symbol = self.all_instrument_information[symbol]
                         pos_ccy = input["posCcy"]
@@ -1001,7 +1050,7 @@ class Okx(Exchange):
                             is_long = False
 
         return Position(
-            margin_type=MarginType[input["mgnMode"].upper()],
+            margin_type=self.margin_type_mapping[input["mgnMode"]],
             api_method=api_method,
             symbol=symbol,
             exchange_update_time_point=convert_unix_timestamp_milliseconds_to_time_point(unix_timestamp_milliseconds=input["uTime"]),
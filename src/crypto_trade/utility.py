@@ -6,7 +6,9 @@ import traceback
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import IntEnum
+from itertools import islice
 from math import ceil, floor
+from typing import Dict
 
 datetime_format_1 = "%Y-%m-%dT%H:%M:%S.%fZ"
 datetime_format_2 = "%Y-%m-%dT%H-%M-%S.%fZ"
@@ -28,6 +30,20 @@ class LogLevel(IntEnum):
     NONE = 90
 
 
+# plain int copies for the logger's level guards, looking up an enum member costs more than the rest of a disabled log call
+log_level_trace = LogLevel.TRACE.value
+log_level_debug = LogLevel.DEBUG.value
+log_level_fine = LogLevel.FINE.value
+log_level_detail = LogLevel.DETAIL.value
+log_level_info = LogLevel.INFO.value
+log_level_warning = LogLevel.WARNING.value
+log_level_error = LogLevel.ERROR.value
+log_level_critical = LogLevel.CRITICAL.value
+
+# source file path -> base name, only a handful of files do the logging
+caller_file_basenames: Dict[str, str] = {}
+
+
 class LoggerApi:
 
     def trace(self, *messages: str) -> None:
@@ -56,156 +72,100 @@ class LoggerApi:
 
 
 class Logger(LoggerApi):
-    def __init__(self, *, level, name, datetime_format=datetime_format_1, sep="\n", end="\n\n", width=160, exit_on_error=False):
+    def __init__(self, *, level, name, datetime_format=datetime_format_1, sep="\n", end="\n\n", width=160, exit_on_error=False, traceback_limit=None):
         self.level = level
         self.name = name
-        self.message_format = "{} {} {{{}:{}:{}}} {}"
         self.datetime_format = datetime_format
+        # the format is split around %f so that the whole-second part is only formatted when the second changes
+        self.datetime_format_parts = tuple(datetime_format.split("%f")) if datetime_format.count("%f") <= 1 and "%%" not in datetime_format else None
+        self.current_datetime_seconds = None
+        self.current_datetime_str_parts = None
         self.sep = sep
         self.end = end
         self.width = width
         self.whitespaces = 10 * " "
         self.exit_on_error = exit_on_error
+        self.traceback_limit = traceback_limit
 
     def trace(self, *messages: str) -> None:
-        if self.level <= LogLevel.TRACE:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"TRACE{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_trace:
+            self.write_log(caller_frame=sys._getframe(1), level_name="TRACE", messages=messages)
 
     def debug(self, *messages: str) -> None:
-        if self.level <= LogLevel.DEBUG:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"DEBUG{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_debug:
+            self.write_log(caller_frame=sys._getframe(1), level_name="DEBUG", messages=messages)
 
     def fine(self, *messages: str) -> None:
-        if self.level <= LogLevel.FINE:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"FINE{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_fine:
+            self.write_log(caller_frame=sys._getframe(1), level_name="FINE", messages=messages)
 
     def detail(self, *messages: str) -> None:
-        if self.level <= LogLevel.DETAIL:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"DETAIL{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_detail:
+            self.write_log(caller_frame=sys._getframe(1), level_name="DETAIL", messages=messages)
 
     def info(self, *messages: str) -> None:
-        if self.level <= LogLevel.INFO:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"INFO{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_info:
+            self.write_log(caller_frame=sys._getframe(1), level_name="INFO", messages=messages)
 
     def warning(self, *messages: str) -> None:
-        if self.level <= LogLevel.WARNING:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    f"WARNING{self.whitespaces}{self.sep.join((self.serialize(object=x, width=self.width) for x in messages))}",
-                ),
-            )
+        if self.level <= log_level_warning:
+            self.write_log(caller_frame=sys._getframe(1), level_name="WARNING", messages=messages)
 
     def error(self, exception: Exception) -> None:
-        if self.level <= LogLevel.ERROR:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    "ERROR",
-                ),
-            )
+        if self.level <= log_level_error:
+            current_datetime_str = self.write_log(caller_frame=sys._getframe(1), level_name="ERROR")
             self.write(current_datetime_str=current_datetime_str, message=repr(exception))
-            self.write(current_datetime_str=current_datetime_str, message=traceback.format_exc())
+            self.write(current_datetime_str=current_datetime_str, message=traceback.format_exc(limit=self.traceback_limit))
             if os.getenv("CRYPTO_TRADE_EXIT_ON_ERROR", "false").lower() == "true" or self.exit_on_error:
                 sys.exit("exit")
 
     def critical(self, exception: Exception) -> None:
-        if self.level <= LogLevel.CRITICAL:
-            current_datetime_str = datetime.now(timezone.utc).strftime(self.datetime_format)
-            caller_frame = sys._getframe(1)
-            self.write(
-                current_datetime_str=current_datetime_str,
-                message=self.message_format.format(
-                    self.name,
-                    datetime.now(timezone.utc).strftime(self.datetime_format),
-                    os.path.basename(caller_frame.f_code.co_filename),
-                    caller_frame.f_code.co_name,
-                    caller_frame.f_lineno,
-                    "CRITICAL",
-                ),
-            )
+        if self.level <= log_level_critical:
+            current_datetime_str = self.write_log(caller_frame=sys._getframe(1), level_name="CRITICAL")
             self.write(current_datetime_str=current_datetime_str, message=repr(exception))
-            self.write(current_datetime_str=current_datetime_str, message=traceback.format_exc())
+            self.write(current_datetime_str=current_datetime_str, message=traceback.format_exc(limit=self.traceback_limit))
             sys.exit("exit")
 
+    def write_log(self, *, caller_frame, level_name, messages=None):
+        # the caller frame is passed in by each level method so that the reported location is the line that logged
+        current_datetime_str = self.format_current_datetime()
+        caller_code = caller_frame.f_code
+        caller_file_basename = caller_file_basenames.get(caller_code.co_filename)
+        if caller_file_basename is None:
+            caller_file_basename = os.path.basename(caller_code.co_filename)
+            caller_file_basenames[caller_code.co_filename] = caller_file_basename
+        if messages is None:
+            body = level_name
+        elif len(messages) == 1:
+            body = f"{level_name}{self.whitespaces}{self.serialize(object=messages[0], width=self.width)}"
+        else:
+            body = f"{level_name}{self.whitespaces}{self.sep.join([self.serialize(object=x, width=self.width) for x in messages])}"
+        self.write(
+            current_datetime_str=current_datetime_str,
+            message=f"{self.name} {current_datetime_str} {{{caller_file_basename}:{caller_code.co_name}:{caller_frame.f_lineno}}} {body}",
+        )
+        return current_datetime_str
+
+    def format_current_datetime(self):
+        if self.datetime_format_parts is None:
+            return datetime.now(timezone.utc).strftime(self.datetime_format)
+
+        seconds, nanoseconds = time_point_now()
+        if seconds != self.current_datetime_seconds:
+            current_datetime = datetime.fromtimestamp(seconds, timezone.utc)
+            self.current_datetime_str_parts = tuple(current_datetime.strftime(x) for x in self.datetime_format_parts)
+            self.current_datetime_seconds = seconds
+
+        current_datetime_str_parts = self.current_datetime_str_parts
+        if len(current_datetime_str_parts) == 1:
+            return current_datetime_str_parts[0]
+        else:
+            return f"{current_datetime_str_parts[0]}{nanoseconds // 1_000:06d}{current_datetime_str_parts[1]}"
+
     def serialize(self, *, object, width):
-        if isinstance(object, (bool, str, int, float, type(None))):
+        if isinstance(object, serialize_as_str_types):
             return str(object)
-        elif isinstance(object, (RestRequest, RestResponse, WebsocketConnection, WebsocketMessage, WebsocketRequest)):
+        elif isinstance(object, serialize_as_readable_dict_types):
             return pprint.pformat(object.as_readable_dict(), width=width)
         else:
             return pprint.pformat(object, width=width)
@@ -255,14 +215,11 @@ class Writer:
             self.write_file[1].write(self.end)
         elif self.write_dir:
             current_datetime_str_key = self.write_current_datetime_str_key(current_datetime_str)
-            write_path = f"{self.write_dir}/{current_datetime_str_key}{self.write_extension}"
-            if not self.write_file:
-                self.open(current_datetime_str_key=current_datetime_str_key, write_path=write_path)
-            else:
-                if self.write_file[0] != current_datetime_str_key:
-                    if not self.write_file[1].closed:
-                        self.write_file[1].close()
-                    self.open(current_datetime_str_key=current_datetime_str_key, write_path=write_path)
+            # the path is only built when a file for a new key has to be opened
+            if not self.write_file or self.write_file[0] != current_datetime_str_key:
+                if self.write_file and not self.write_file[1].closed:
+                    self.write_file[1].close()
+                self.open(current_datetime_str_key=current_datetime_str_key, write_path=f"{self.write_dir}/{current_datetime_str_key}{self.write_extension}")
             self.write_file[1].write(message)
             self.write_file[1].write(self.end)
         else:
@@ -292,6 +249,8 @@ class RestRequest:
     METHOD_TRACE = "TRACE"
     METHOD_PATCH = "PATCH"
 
+    __slots__ = ("id", "base_url", "method", "path", "query_params", "query_string", "headers", "json_payload", "payload", "extra_data")
+
     def __init__(
         self,
         *,
@@ -313,7 +272,7 @@ class RestRequest:
         self.path = path
         self.query_params = query_params
         if query_params:
-            self.query_string = "&".join([f"{k}={v}" for k, v in sorted(dict(query_params).items())])
+            self.query_string = create_query_string(query_params=query_params)
         else:
             self.query_string = query_string
         self.headers = headers
@@ -325,7 +284,18 @@ class RestRequest:
         self.extra_data = extra_data
 
     def as_readable_dict(self):
-        return self.__dict__
+        return {
+            "id": self.id,
+            "base_url": self.base_url,
+            "method": self.method,
+            "path": self.path,
+            "query_params": self.query_params,
+            "query_string": self.query_string,
+            "headers": self.headers,
+            "json_payload": self.json_payload,
+            "payload": self.payload,
+            "extra_data": self.extra_data,
+        }
 
     @property
     def url(self):
@@ -337,6 +307,16 @@ class RestRequest:
 
 
 class RestResponse:
+    __slots__ = (
+        "status_code",
+        "payload",
+        "headers",
+        "json_deserialized_payload",
+        "rest_request",
+        "next_rest_request_function",
+        "next_rest_request_delay_seconds",
+    )
+
     def __init__(
         self,
         *,
@@ -351,8 +331,9 @@ class RestResponse:
         self.status_code = status_code
         self.payload = payload
         self.headers = headers
+        # a response without a Content-Type header is treated as not json rather than raising KeyError
         self.json_deserialized_payload = (
-            json_deserialize(payload) if payload and headers["Content-Type"].startswith("application/json") and json_deserialize else None
+            json_deserialize(payload) if payload and json_deserialize and headers and headers.get("Content-Type", "").startswith("application/json") else None
         )
         self.rest_request = rest_request
         self.next_rest_request_function = next_rest_request_function
@@ -371,6 +352,8 @@ class RestResponse:
 
 
 class WebsocketConnection:
+    __slots__ = ("base_url", "path", "query_params", "connection", "latest_receive_message_time_point")
+
     def __init__(self, *, base_url=None, path=None, query_params=None, connection=None):
         self.base_url = base_url
         self.path = path
@@ -392,6 +375,8 @@ class WebsocketConnection:
 
 
 class WebsocketMessage:
+    __slots__ = ("websocket_connection", "payload", "json_deserialized_payload", "payload_summary", "websocket_request_id", "websocket_request")
+
     def __init__(
         self, *, websocket_connection=None, payload=None, json_deserialize=None, payload_summary=None, websocket_request_id=None, websocket_request=None
     ):
@@ -414,6 +399,8 @@ class WebsocketMessage:
 
 
 class WebsocketRequest:
+    __slots__ = ("id", "json_payload", "payload", "extra_data")
+
     def __init__(self, *, id=None, payload=None, json_payload=None, json_serialize=None, extra_data=None):
         self.id = id
         self.json_payload = json_payload
@@ -424,9 +411,18 @@ class WebsocketRequest:
         self.extra_data = extra_data
 
     def as_readable_dict(self):
-        return self.__dict__
+        return {
+            "id": self.id,
+            "json_payload": self.json_payload,
+            "payload": self.payload,
+            "extra_data": self.extra_data,
+        }
 
 
+# a tuple of names is rebuilt on every evaluation, so the types checked by Logger.serialize are built once here
+serialize_as_str_types = (bool, str, int, float, type(None))
+serialize_as_readable_dict_types = (RestRequest, RestResponse, WebsocketConnection, WebsocketMessage, WebsocketRequest)
+
 one_thousand = 1_000
 one_million = 1_000_000
 one_billion = 1_000_000_000
@@ -471,21 +467,21 @@ def convert_time_point_to_datetime(*, time_point):
 
 def convert_list_to_sublists(*, input, sublist_length):
     if sublist_length:
-        return [input[i * sublist_length : (i + 1) * sublist_length] for i in range((len(input) + sublist_length - 1) // sublist_length)]
+        return [input[i : i + sublist_length] for i in range(0, len(input), sublist_length)]
     else:
         return [input]
 
 
 def convert_set_to_subsets(*, input, subset_length):
     if subset_length:
-        input_list = list(input)
-        return [set(input_list[i * subset_length : (i + 1) * subset_length]) for i in range((len(input_list) + subset_length - 1) // subset_length)]
+        input_iterator = iter(input)
+        return [set(islice(input_iterator, subset_length)) for _ in range((len(input) + subset_length - 1) // subset_length)]
     else:
         return [input]
 
 
 def get_base_url_from_url(*, url):
-    url_splits = url.split("/")
+    url_splits = url.split("/", 3)
     return f"{url_splits[0]}//{url_splits[2]}"
 
 
@@ -497,7 +493,7 @@ def convert_unix_timestamp_milliseconds_to_time_point(*, unix_timestamp_millisec
 def round_to_nearest(*, input, increment=None, increment_as_float=None, increment_as_decimal=None):
     if increment_as_decimal is None:
         increment_as_decimal = Decimal(increment)
-    if increment is None:
+    if increment_as_float is None:
         increment_as_float = float(increment_as_decimal)
     return increment_as_decimal * round(round_calculate_divide(input=input, increment=increment, increment_as_float=increment_as_float))
 
@@ -505,7 +501,7 @@ def round_to_nearest(*, input, increment=None, increment_as_float=None, incremen
 def round_up(*, input, increment=None, increment_as_float=None, increment_as_decimal=None):
     if increment_as_decimal is None:
         increment_as_decimal = Decimal(increment)
-    if increment is None:
+    if increment_as_float is None:
         increment_as_float = float(increment_as_decimal)
     return increment_as_decimal * ceil(round_calculate_divide(input=input, increment=increment, increment_as_float=increment_as_float))
 
@@ -513,7 +509,7 @@ def round_up(*, input, increment=None, increment_as_float=None, increment_as_dec
 def round_down(*, input, increment=None, increment_as_float=None, increment_as_decimal=None):
     if increment_as_decimal is None:
         increment_as_decimal = Decimal(increment)
-    if increment is None:
+    if increment_as_float is None:
         increment_as_float = float(increment_as_decimal)
     return increment_as_decimal * floor(round_calculate_divide(input=input, increment=increment, increment_as_float=increment_as_float))
 
@@ -529,9 +525,13 @@ def create_url(*, base_url, path):
     return base_url + path
 
 
+def create_query_string(*, query_params):
+    return "&".join([f"{k}={v}" for k, v in sorted(dict(query_params).items())])
+
+
 def create_path_with_query_params(*, path, query_params):
     if query_params:
-        return "?".join((path, "&".join([f"{k}={v}" for k, v in sorted(dict(query_params).items())])))
+        return "?".join((path, create_query_string(query_params=query_params)))
     else:
         return path
 
@@ -555,12 +555,17 @@ def remove_leading_negative_sign_in_string(*, input):
     return input[1:] if input.startswith("-") else input
 
 
+def is_decimal_string_zero(*, input):
+    digits = input.strip("+-0.")
+    return not digits or digits[0] in "eE"
+
+
 def normalize_decimal_string(*, input):
     return input.rstrip("0").rstrip(".") if "." in input and input[-1] == "0" else input
 
 
 def convert_decimal_to_string(*, input, normalize=False):
-    output = "{0:f}".format(input)
+    output = f"{input:f}"
     if normalize:
         output = normalize_decimal_string(input=output)
     return output
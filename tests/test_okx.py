@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from crypto_trade.exchange_api import ApiMethod, Bbo, Fill, Ohlcv, Trade
+from crypto_trade.exchanges.okx import Okx, OkxInstrumentType
+from crypto_trade.utility import (
+    RestRequest,
+    RestResponse,
+    WebsocketConnection,
+    WebsocketMessage,
+)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def create_exchange(loop):
+    exchanges = []
+
+    async def create(exchange_class, kwargs):
+        return exchange_class(**{"instrument_type": OkxInstrumentType.SPOT, "symbols": {"BTC-USDT"}, **kwargs})
+
+    def create_exchange(*, exchange_class=Okx, **kwargs):
+        exchange = loop.run_until_complete(create(exchange_class, kwargs))
+        exchanges.append(exchange)
+        return exchange
+
+    yield create_exchange
+
+    for exchange in exchanges:
+        loop.run_until_complete(exchange.client_session.close())
+
+
+def test_sign_request_uses_current_api_secret(create_exchange):
+    exchange = create_exchange(api_key="key", api_secret="secret_1", api_passphrase="passphrase")
+    for api_secret in ("secret_1", "secret_2"):
+        exchange.api_secret = api_secret
+        rest_request = RestRequest(base_url=exchange.rest_account_base_url, method=RestRequest.METHOD_GET, path="/api/v5/account/balance")
+        exchange.sign_request(rest_request=rest_request, time_point=(1700000000, 123456789))
+        assert rest_request.headers["OK-ACCESS-TIMESTAMP"] == "2023-11-14T22:13:20.123Z"
+        expected = hmac.new(api_secret.encode(), b"2023-11-14T22:13:20.123ZGET/api/v5/account/balance", digestmod=hashlib.sha256).digest()
+        assert rest_request.headers["OK-ACCESS-SIGN"] == base64.b64encode(expected).decode()
+
+        expected = hmac.new(api_secret.encode(), b"1700000000GET/users/self/verify", digestmod=hashlib.sha256).digest()
+        assert exchange.websocket_login_create_signature(timestamp=1700000000) == base64.b64encode(expected).decode()
+
+
+def test_sign_request_without_api_secret(create_exchange):
+    exchange = create_exchange(api_secret=None)
+    rest_request = RestRequest(base_url=exchange.rest_account_base_url, method=RestRequest.METHOD_GET, path="/api/v5/account/balance")
+    exchange.sign_request(rest_request=rest_request, time_point=(1700000000, 123456789))
+    expected = hmac.new(b"", b"2023-11-14T22:13:20.123ZGET/api/v5/account/balance", digestmod=hashlib.sha256).digest()
+    assert rest_request.headers["OK-ACCESS-SIGN"] == base64.b64encode(expected).decode()
+
+
+def create_rest_response(*, path, method):
+    return RestResponse(rest_request=RestRequest(method=method, path=path), status_code=200, payload="{}")
+
+
+@pytest.mark.parametrize(
+    "path, method, handler_name",
+    [
+        ("/api/v5/public/instruments", RestRequest.METHOD_GET, "handle_rest_response_for_all_instrument_information"),
+        ("/api/v5/market/tickers", RestRequest.METHOD_GET, "handle_rest_response_for_bbo"),
+        ("/api/v5/market/history-trades", RestRequest.METHOD_GET, "handle_rest_response_for_historical_trade"),
+        ("/api/v5/market/history-candles", RestRequest.METHOD_GET, "handle_rest_response_for_historical_ohlcv"),
+        ("/api/v5/trade/order", RestRequest.METHOD_POST, "handle_rest_response_for_create_order"),
+        ("/api/v5/trade/order", RestRequest.METHOD_GET, "handle_rest_response_for_fetch_order"),
+        ("/api/v5/trade/cancel-order", RestRequest.METHOD_POST, "handle_rest_response_for_cancel_order"),
+        ("/api/v5/trade/orders-pending", RestRequest.METHOD_GET, "handle_rest_response_for_fetch_open_order"),
+        ("/api/v5/account/positions", RestRequest.METHOD_GET, "handle_rest_response_for_fetch_position"),
+        ("/api/v5/account/balance", RestRequest.METHOD_GET, "handle_rest_response_for_fetch_balance"),
+        ("/api/v5/trade/orders-history", RestRequest.METHOD_GET, "handle_rest_response_for_historical_order"),
+        ("/api/v5/trade/orders-history-archive", RestRequest.METHOD_GET, "handle_rest_response_for_historical_order"),
+        ("/api/v5/trade/fills", RestRequest.METHOD_GET, "handle_rest_response_for_historical_fill"),
+        ("/api/v5/trade/fills-history", RestRequest.METHOD_GET, "handle_rest_response_for_historical_fill"),
+        ("/unknown", RestRequest.METHOD_GET, None),
+    ],
+)
+def test_get_rest_response_handler(create_exchange, path, method, handler_name):
+    exchange = create_exchange()
+    expected = getattr(exchange, handler_name) if handler_name else None
+    # the second lookup is served from the handler table
+    for _ in range(2):
+        assert exchange.get_rest_response_handler(rest_response=create_rest_response(path=path, method=method)) == expected
+
+
+def test_get_rest_response_handler_follows_overridden_predicate(create_exchange):
+    class OkxWithoutBbo(Okx):
+        def is_rest_response_for_bbo(self, *, rest_response):
+            return False
+
+    exchange = create_exchange(exchange_class=OkxWithoutBbo)
+    rest_response = create_rest_response(path=exchange.rest_market_data_fetch_bbo_path, method=RestRequest.METHOD_GET)
+    assert exchange.get_rest_response_handler(rest_response=rest_response) is None
+
+
+@pytest.mark.parametrize("rest_fetch_historical_data_max_concurrent_symbols", [0, -1, None, True, False, 2.0])
+def test_reject_invalid_rest_fetch_historical_data_max_concurrent_symbols(create_exchange, rest_fetch_historical_data_max_concurrent_symbols):
+    with pytest.raises(ValueError):
+        create_exchange(rest_fetch_historical_data_max_concurrent_symbols=rest_fetch_historical_data_max_concurrent_symbols)
+
+
+def test_websocket_market_data_subscribe_payloads(create_exchange):
+    exchange = create_exchange(subscribe_bbo=True, subscribe_trade=True, subscribe_ohlcv=True)
+
+    payload = json.loads(
+        exchange.websocket_market_data_update_subscribe_create_websocket_request_for_bbo_trade(symbols={"BTC-USDT"}, is_subscribe=True).payload
+    )
+    assert payload == {"op": "subscribe", "args": [{"channel": "bbo-tbt", "instId": "BTC-USDT"}, {"channel": "trades", "instId": "BTC-USDT"}]}
+
+    payload = json.loads(exchange.websocket_market_data_update_subscribe_create_websocket_request_for_ohlcv(symbols={"BTC-USDT"}, is_subscribe=True).payload)
+    assert payload == {"op": "subscribe", "args": [{"channel": "candle1m", "instId": "BTC-USDT"}]}
+
+
+def test_websocket_account_subscribe_payload(create_exchange):
+    exchange = create_exchange(subscribe_order=True, subscribe_position=True, subscribe_balance=True)
+
+    payload = json.loads(exchange.websocket_account_update_subscribe_create_websocket_request(is_subscribe=True).payload)
+    assert payload == {"op": "subscribe", "args": [{"channel": "orders", "instType": "SPOT"}, {"channel": "balance_and_position", "instType": "SPOT"}]}
+
+
+def create_websocket_message(*, exchange, channel):
+    websocket_connection = WebsocketConnection(base_url=exchange.websocket_market_data_base_url, path=exchange.websocket_market_data_path)
+    websocket_message = WebsocketMessage(
+        websocket_connection=websocket_connection, payload=json.dumps({"arg": {"channel": channel}, "data": []}), json_deserialize=json.loads
+    )
+    return exchange.websocket_on_message_extract_data(websocket_connection=websocket_connection, websocket_message=websocket_message)
+
+
+@pytest.mark.parametrize(
+    "channel, handler_name",
+    [
+        ("bbo-tbt", "handle_websocket_push_data_for_bbo"),
+        ("trades", "handle_websocket_push_data_for_trade"),
+        ("candle1m", "handle_websocket_push_data_for_ohlcv"),
+        ("candle5m", "handle_websocket_push_data_for_ohlcv"),
+        ("orders", "handle_websocket_push_data_for_order"),
+        ("positions", "handle_websocket_push_data_for_position"),
+        ("balance_and_position", "handle_websocket_push_data_for_balance"),
+        ("unknown", None),
+    ],
+)
+def test_get_websocket_push_data_handler(create_exchange, channel, handler_name):
+    exchange = create_exchange()
+    expected = getattr(exchange, handler_name) if handler_name else None
+    # the second lookup is served from the handler table
+    for _ in range(2):
+        assert exchange.get_websocket_push_data_handler(websocket_message=create_websocket_message(exchange=exchange, channel=channel)) == expected
+
+
+def test_get_websocket_push_data_handler_follows_overridden_predicate(create_exchange):
+    class OkxWithoutTrade(Okx):
+        def is_websocket_push_data_for_trade(self, *, websocket_message):
+            return False
+
+    exchange = create_exchange(exchange_class=OkxWithoutTrade)
+    websocket_message = create_websocket_message(exchange=exchange, channel=exchange.websocket_market_data_channel_trade)
+    assert exchange.get_websocket_push_data_handler(websocket_message=websocket_message) is None
+
+
+@pytest.mark.parametrize("rest_fetch_historical_data_max_concurrent_symbols, expected_max_in_flight", [(1, 1), (2, 4)])
+def test_rest_market_data_fetch_historical_data_concurrency(loop, create_exchange, rest_fetch_historical_data_max_concurrent_symbols, expected_max_in_flight):
+    exchange = create_exchange(
+        symbols={"BTC-USDT", "ETH-USDT", "SOL-USDT"},
+        fetch_historical_trade_at_start=True,
+        fetch_historical_ohlcv_at_start=True,
+        rest_fetch_historical_data_max_concurrent_symbols=rest_fetch_historical_data_max_concurrent_symbols,
+    )
+    in_flight = []
+    max_in_flight = 0
+
+    async def fetch(*, symbol):
+        nonlocal max_in_flight
+        in_flight.append(symbol)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(symbol)
+
+    exchange.rest_market_data_fetch_historical_trade = fetch
+    exchange.rest_market_data_fetch_historical_ohlcv = fetch
+    loop.run_until_complete(exchange.rest_market_data_fetch_historical_data())
+    assert max_in_flight == expected_max_in_flight
+
+
+def test_convert_websocket_push_data(create_exchange):
+    exchange = create_exchange()
+    time_point = (1700000000, 123000000)
+
+    assert exchange.convert_websocket_push_data_for_bbo(
+        json_deserialized_payload={"arg": {"instId": "BTC-USDT"}, "data": [{"ts": "1700000000123", "bids": [["1.5", "2", "0", "1"]], "asks": []}]}
+    ) == [
+        Bbo(
+            api_method=ApiMethod.WEBSOCKET,
+            symbol="BTC-USDT",
+            exchange_update_time_point=time_point,
+            best_bid_price="1.5",
+            best_bid_size="2",
+            best_ask_price=None,
+            best_ask_size=None,
+        )
+    ]
+
+    assert exchange.convert_websocket_push_data_for_trade(
+        json_deserialized_payload={"arg": {"instId": "BTC-USDT"}, "data": [{"ts": "1700000000123", "tradeId": "5", "px": "1.5", "sz": "2", "side": "sell"}]}
+    ) == [
+        Trade(
+            api_method=ApiMethod.WEBSOCKET,
+            symbol="BTC-USDT",
+            exchange_update_time_point=time_point,
+            trade_id="5",
+            price="1.5",
+            size="2",
+            is_buyer_maker=True,
+        )
+    ]
+
+    assert exchange.convert_websocket_push_data_for_ohlcv(
+        json_deserialized_payload={"arg": {"instId": "BTC-USDT"}, "data": [["1700000000000", "1", "2", "0.5", "1.5", "10", "11", "12", "1"]]}
+    ) == [
+        Ohlcv(
+            api_method=ApiMethod.WEBSOCKET,
+            symbol="BTC-USDT",
+            start_unix_timestamp_seconds=1700000000,
+            open_price="1",
+            high_price="2",
+            low_price="0.5",
+            close_price="1.5",
+            volume="10",
+            base_volume="10",
+            quote_volume="12",
+        )
+    ]
+
+    fill = {
+        "fillTime": "1700000000123",
+        "ordId": "1",
+        "clOrdId": "c",
+        "tradeId": "9",
+        "side": "buy",
+        "fillPx": "1",
+        "fillSz": "2",
+        "execType": "M",
+        "fillFee": "-0.001",
+        "fillFeeCcy": "USDT",
+        "instId": "BTC-USDT",
+    }
+    fills = exchange.convert_websocket_push_data_for_fill(
+        json_deserialized_payload={"data": [fill, dict(fill, fillFee="0.5", execType="T"), dict(fill, fillFee="0E-8"), dict(fill, tradeId="")]}
+    )
+    assert [(x.fee_quantity, x.is_fee_rebate, x.is_maker) for x in fills] == [("0.001", False, True), ("0.5", True, False), ("0E-8", None, True)]
+    assert fills[0] == Fill(
+        api_method=ApiMethod.WEBSOCKET,
+        symbol="BTC-USDT",
+        exchange_update_time_point=time_point,
+        order_id="1",
+        client_order_id="c",
+        trade_id="9",
+        is_buy=True,
+        price="1",
+        quantity="2",
+        is_maker=True,
+        fee_asset="USDT",
+        fee_quantity="0.001",
+        is_fee_rebate=False,
+    )
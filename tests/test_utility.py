@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+from decimal import Decimal
+
+import pytest
+
+from crypto_trade.utility import is_decimal_string_zero
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        ("0", True),
+        ("-0", True),
+        ("+0", True),
+        ("0.000", True),
+        ("-0.0", True),
+        ("0E-8", True),
+        ("0e+3", True),
+        ("", True),
+        ("100", False),
+        ("10.0", False),
+        ("0.50", False),
+        ("-0.001", False),
+        ("1e-3", False),
+        ("-1E-8", False),
+    ],
+)
+def test_is_decimal_string_zero(input, expected):
+    assert is_decimal_string_zero(input=input) is expected
+    if input:
+        assert is_decimal_string_zero(input=input) is (Decimal(input) == 0)
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import asyncio
 import os
 import sys
 import traceback
@@ -35,8 +34,7 @@ async def main():
 
 
 def test_start_stop():
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # pylint: disable=possibly-used-before-assignment
-    asyncio.run(main())
+    uvloop.run(main())  # pylint: disable=possibly-used-before-assignment
 
 
 if __name__ == "__main__":